@@ -0,0 +1,42 @@
+"""
+Simple on-disk cache for LLM outputs
+Keyed by a SHA-256 of the exact prompts so repeat runs (demos, tests,
+development iteration) skip the GPT-4o round-trips entirely.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+# Cache lives alongside other per-user caches
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "boston_guide")
+
+
+def cache_key(model, *parts):
+    """Build a deterministic SHA-256 key from the model name and prompt parts"""
+    payload = json.dumps([model] + list(parts), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_cached(key):
+    """Return the cached dict for key, or None on miss/corruption"""
+    path = os.path.join(CACHE_DIR, key + ".json")
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_cached(key, data):
+    """Atomically write data (a JSON-serializable dict) under key"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, os.path.join(CACHE_DIR, key + ".json"))
+    except OSError:
+        # Caching is best-effort - never let it break a run
+        pass
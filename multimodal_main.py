@@ -5,64 +5,153 @@ Now supports both text and speech interaction!
 """
 
 import os
+import asyncio
+import functools
+import threading
 import warnings
 import locale
 import sys
-from crewai import Agent, Task, Crew, Process
-from crewai import LLM
-from speech_utils import SpeechManager
+from llm_cache import cache_key, load_cached, save_cached
 import re
 
 # Suppress warnings
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 
-llm = LLM(model="gpt-4o")
+# Fused speech text cleaning, built once at import: a single alternation
+# regex handles bold/italic/headers, and one C-level str.translate pass
+# deletes separator chars and emojis instead of extra full-string regex walks
+_FORMAT_RE = re.compile(r'\*\*([^*]+)\*\*|\*([^*]+)\*|#{1,6}\s*')
+_DELETE_TABLE = str.maketrans('', '', '=🎓🌟📍👋🍜🥢🌮🎨🏃🎭🎯')
 
-def create_introduction_task(user_choice, agent):
-    """Create a self-introduction task based on user preference"""
-    base_intro = """
-    Introduce yourself as Tong in 3-5 sentences. You are a Harvard M.S. Data Science student originally from Shenzhen, China, 
-    who studied in Beijing for college. You love street dance (choreography and K-pop), cooking and tasting food, city walks, 
-    traveling, exploring new things, artistic experiences, movies, and caring for plants and animals (especially dogs and birds).
-    You bring warmth, curiosity, and creativity into conversations.
+# Single alternation regex for voice-choice parsing - one scan of the
+# transcript instead of ~15 separate substring searches. Short keywords
+# are end-anchored so they don't prefix-match other words ("all" must
+# not fire on "Allston"); stems like restaurant/activit/cook stay open
+# to keep matching their plural and -ing forms
+_CHOICE_RE = re.compile(
+    r'\b(?P<one>1\b|one\b|food\b|restaurant|eat\b|dining|cook)'
+    r'|\b(?P<two>2\b|two\b|activity|activities|things to do|fun\b|experience)'
+    r'|\b(?P<three>3\b|three\b|both\b|everything|all\b)',
+    re.IGNORECASE
+)
+_CHOICE_GROUPS = {"one": "1", "two": "2", "three": "3"}
+
+# Sentence boundary used when streaming LLM output into the speech
+# pipeline. Whitespace after the punctuation is required: the buffer end
+# is not a boundary ('1.' or '2.5' may just be a delta cut mid-number),
+# and the tail flush handles text with no trailing whitespace
+_SENTENCE_END_RE = re.compile(r'[.!?]\s')
+
+# Start of a new numbered list item - everything before it is a complete
+# recommendation and can be spoken even without terminal punctuation
+_ITEM_START_RE = re.compile(r'\n(?=\s*\d+\.\s)')
+
+_CHOICE_NAMES = {"1": "food", "2": "activities", "3": "both"}
+_VALID_CHOICES = frozenset({"1", "2", "3"})
+
+def _ask_choice(prompt):
+    """Prompt until the user types one of the three valid choices"""
+    while True:
+        choice = input(prompt).strip()
+        if choice in _VALID_CHOICES:
+            return choice
+        print("❌ Invalid choice! Please type 1, 2, or 3.")
+
+# Confirmation + transition pairs spoken after the user picks a choice,
+# keyed by how the choice arrived. Each pair is joined into a single TTS
+# request instead of two sequential gTTS round-trips.
+_CONFIRM_TEMPLATES = {
+    "voice": (
+        "Perfect! I'll give you {name} recommendations. "
+        "Let me start by introducing myself, and then I'll share some amazing {name} suggestions that I think you'll really enjoy!"
+    ),
+    "voice_text_fallback": (
+        "Perfect! You chose {name} recommendations. Now I'll continue in voice mode. "
+        "Let me introduce myself first, and then I'll share some excellent {name} suggestions with you!"
+    ),
+    "mixed_text": (
+        "Perfect! You chose {name} recommendations. "
+        "Let me start by introducing myself, and then I'll share some great {name} suggestions that I think you'll love!"
+    ),
+    "mixed_voice": (
+        "Great! I heard you chose {name} recommendations. "
+        "Let me start by introducing myself, and then I'll share some wonderful {name} suggestions that I think will be perfect for you!"
+    ),
+    "mixed_fallback": (
+        "Got it! You chose {name}. "
+        "Now let me introduce myself, and then I'll share some fantastic {name} recommendations that I think will be perfect for you!"
+    ),
+}
+
+def _say_pair(speech_manager, choice, tag):
+    """Speak the confirmation + transition for a choice as one TTS call"""
+    message = _CONFIRM_TEMPLATES[tag].format(name=_CHOICE_NAMES[choice])
+    speech_manager.text_to_speech(message, use_gtts=True)
+
+def _strip_format(match):
+    """Keep the inner text of bold/italic markup, drop markdown headers"""
+    return match.group(1) or match.group(2) or ''
+
+def _clean_for_speech(text):
+    """Strip markdown formatting, separators and emojis for speech output
+
+    Single source of truth for the cleaning rules so display and speech
+    never drift apart - used for the intro, recommendations and streamed
+    sentences alike.
     """
-    
-    if user_choice == "1":
-        description = base_intro + """
-        Focus on your passion for food, cooking, and trying new restaurants. Emphasize your love for Asian cuisine 
-        and exploring diverse flavors. Make it clear why food recommendations would be perfect for you.
-        """
-        expected_output = "A warm 3-5 sentence introduction emphasizing Tong's food interests and dining preferences."
-        
-    elif user_choice == "2":
-        description = base_intro + """
-        Focus on your love for activities and experiences. Emphasize your interests in street dance, K-pop, 
-        city walks, movies, artistic experiences, and exploring new things. Show your adventurous spirit.
-        """
-        expected_output = "A warm 3-5 sentence introduction emphasizing Tong's activity interests and adventurous nature."
-        
-    elif user_choice == "3":
-        description = base_intro + """
-        Provide a balanced introduction that highlights both your food interests (cooking, trying restaurants) 
-        and your activity interests (dancing, movies, city walks, art). Show your well-rounded personality.
-        """
-        expected_output = "A warm 3-5 sentence balanced introduction covering both Tong's food and activity interests."
-
-    return Task(
-        description=description,
-        expected_output=expected_output,
-        agent=agent,
-        max_iter=1
-    )
+    return _FORMAT_RE.sub(_strip_format, text).translate(_DELETE_TABLE)
 
-def create_boston_guide_task(user_choice, agent, intro_task):
-    """Create recommendation task that uses the introduction as context"""
-    
-    base_requirements = """
-    You are Tong. Based on your personal introduction from the previous task, give personalized recommendations 
+@functools.lru_cache(maxsize=1)
+def get_llm():
+    """Build the shared LLM instance on first use
+
+    crewai's import chain (litellm, pydantic, ...) takes seconds on a cold
+    start, so it stays out of module import time and off early-exit paths.
+    """
+    from crewai import LLM
+    return LLM(model="gpt-4o")
+
+# Shared system prompt for every recommendation call. Keeping it a single
+# byte-identical constant maximizes server-side prompt-cache hits across
+# tasks and across repeat runs.
+_TONG_BACKSTORY = """You are Tong, a Harvard M.S. Data Science student originally from Shenzhen, China,
+        who studied in Beijing for college. You love street dance (choreography and K-pop), cooking and tasting food,
+        city walks, traveling, exploring new things, artistic experiences, movies, and caring for plants and animals
+        (especially dogs and birds). You excel at connecting your personal interests to specific places and
+        experiences in the Boston area, especially for students."""
+
+# Tong's self-introductions, pre-authored once per choice. The intro only
+# ever varies by which interests to emphasize, so generating it with
+# GPT-4o on every run paid a full LLM round-trip for fixed text.
+_TONG_INTROS = {
+    "1": (
+        "Hi, I'm Tong! I'm a Harvard M.S. Data Science student, originally from Shenzhen, China, "
+        "and I studied in Beijing for college. Food is my love language - I adore cooking, tasting new dishes, "
+        "and hunting down amazing Asian cuisine and hidden restaurant gems wherever I go. "
+        "Nothing makes me happier than sharing a great meal, so food recommendations are absolutely my thing!"
+    ),
+    "2": (
+        "Hi, I'm Tong! I'm a Harvard M.S. Data Science student, originally from Shenzhen, China, "
+        "and I studied in Beijing for college. I'm happiest when I'm out exploring - street dance and K-pop "
+        "choreography, city walks, movies, and all kinds of artistic experiences keep my adventurous spirit busy. "
+        "I love discovering new things, so activity recommendations are right up my alley!"
+    ),
+    "3": (
+        "Hi, I'm Tong! I'm a Harvard M.S. Data Science student, originally from Shenzhen, China, "
+        "and I studied in Beijing for college. I love cooking and tasting food just as much as I love street "
+        "dance, K-pop, city walks, movies, and artistic experiences. "
+        "With my curiosity split between great food and fun adventures, I have plenty of both to share with you!"
+    ),
+}
+
+# Recommendation prompt pieces, assembled once at import. Fixed text comes
+# first and the per-choice introduction last, so the task descriptions share
+# a stable prefix for server-side prompt caching.
+_BASE_REQUIREMENTS = """
+    You are Tong. Based on your personal introduction below, give personalized recommendations
     that align with YOUR interests and background as a Harvard Data Science student.
-    
+
     Requirements:
     - Reference YOUR introduction when explaining why recommendations fit YOUR personality
     - Format as numbered Markdown lists
@@ -71,53 +160,85 @@ def create_boston_guide_task(user_choice, agent, intro_task):
     - Focus on Cambridge, Allston, Brighton, Boston proper, Brookline, and Somerville
     - Focus on budget-friendly options for students
     """
-    
-    if user_choice == "1":
-        description = base_requirements + """
-        - Recommend EXACTLY 3 different student-friendly restaurants
-        - Connect each recommendation to your food interests mentioned in the introduction
-        - Stop after exactly 3 recommendations
-        """
-        expected_output = """A numbered Markdown list with exactly 3 restaurants formatted as:
-        1. 🍜 **Restaurant Name** - Brief description connecting to your food interests (1-2 sentences)
-        2. 🥢 **Restaurant Name** - Brief description connecting to your food interests (1-2 sentences)  
-        3. 🌮 **Restaurant Name** - Brief description connecting to your food interests (1-2 sentences)"""
-
-    elif user_choice == "2":
-        description = base_requirements + """
-        - Recommend EXACTLY 3 different student-friendly activities
-        - Connect each recommendation to your activity interests mentioned in the introduction
-        - Stop after exactly 3 recommendations
-        """
-        expected_output = """A numbered Markdown list with exactly 3 activities formatted as:
-        1. 🎨 **Activity Name** - Brief description connecting to your interests (1-2 sentences)
-        2. 🏃 **Activity Name** - Brief description connecting to your interests (1-2 sentences)
-        3. 🎭 **Activity Name** - Brief description connecting to your interests (1-2 sentences)"""
-
-    elif user_choice == "3":
-        description = base_requirements + """
-        - Recommend EXACTLY 3 restaurants AND 3 activities
-        - Connect each recommendation to your interests mentioned in the introduction
-        - Stop after exactly 6 total recommendations
-        """
-        expected_output = """Two numbered Markdown lists:
-        ## Restaurants
-        1. 🍜 **Restaurant Name** - Brief description connecting to your interests (1-2 sentences)
-        2. 🥢 **Restaurant Name** - Brief description connecting to your interests (1-2 sentences)
-        3. 🌮 **Restaurant Name** - Brief description connecting to your interests (1-2 sentences)
-
-        ## Activities  
-        1. 🎨 **Activity Name** - Brief description connecting to your interests (1-2 sentences)
-        2. 🏃 **Activity Name** - Brief description connecting to your interests (1-2 sentences)
-        3. 🎭 **Activity Name** - Brief description connecting to your interests (1-2 sentences)"""
-
-    return Task(
-        description=description,
-        expected_output=expected_output,
-        agent=agent,
-        max_iter=1,
-        context=[intro_task]  # Use introduction task as context
-    )
+
+_INTRO_CONTEXT = """
+    Your introduction:
+    {intro}
+    """
+
+_RESTAURANT_RULES = """
+    - Recommend EXACTLY 3 different student-friendly restaurants
+    - Connect each recommendation to your food interests mentioned in the introduction
+    - Stop after exactly 3 recommendations
+    """
+_RESTAURANT_EXPECTED = """A numbered Markdown list with exactly 3 restaurants formatted as:
+    1. 🍜 **Restaurant Name** - Brief description connecting to your food interests (1-2 sentences)
+    2. 🥢 **Restaurant Name** - Brief description connecting to your food interests (1-2 sentences)
+    3. 🌮 **Restaurant Name** - Brief description connecting to your food interests (1-2 sentences)"""
+
+_ACTIVITY_RULES = """
+    - Recommend EXACTLY 3 different student-friendly activities
+    - Connect each recommendation to your activity interests mentioned in the introduction
+    - Stop after exactly 3 recommendations
+    """
+_ACTIVITY_EXPECTED = """A numbered Markdown list with exactly 3 activities formatted as:
+    1. 🎨 **Activity Name** - Brief description connecting to your interests (1-2 sentences)
+    2. 🏃 **Activity Name** - Brief description connecting to your interests (1-2 sentences)
+    3. 🎭 **Activity Name** - Brief description connecting to your interests (1-2 sentences)"""
+
+def _build_guide_specs():
+    """Precompute the (description, expected_output) pairs per user choice"""
+    restaurant_header_rule = "    - Start your answer with a '## Restaurants' Markdown header\n"
+    activity_header_rule = "    - Start your answer with a '## Activities' Markdown header\n"
+
+    specs = {}
+    for choice, intro in _TONG_INTROS.items():
+        intro_context = _INTRO_CONTEXT.format(intro=intro)
+        if choice == "1":
+            specs[choice] = [
+                (_BASE_REQUIREMENTS + _RESTAURANT_RULES + intro_context, _RESTAURANT_EXPECTED),
+            ]
+        elif choice == "2":
+            specs[choice] = [
+                (_BASE_REQUIREMENTS + _ACTIVITY_RULES + intro_context, _ACTIVITY_EXPECTED),
+            ]
+        else:
+            # Two independent tasks so restaurants and activities run in
+            # parallel, each starting with its own Markdown header
+            specs[choice] = [
+                (_BASE_REQUIREMENTS + _RESTAURANT_RULES + restaurant_header_rule + intro_context,
+                 "A '## Restaurants' header followed by:\n" + _RESTAURANT_EXPECTED),
+                (_BASE_REQUIREMENTS + _ACTIVITY_RULES + activity_header_rule + intro_context,
+                 "A '## Activities' header followed by:\n" + _ACTIVITY_EXPECTED),
+            ]
+    return specs
+
+_GUIDE_SPECS = _build_guide_specs()
+
+def create_boston_guide_tasks(user_choice, agents):
+    """Create recommendation task(s) for the user's choice
+
+    The prompt strings are precomputed at import, so this is a pure dict
+    lookup plus Task construction. Choice "3" maps to two independent
+    tasks (restaurants + activities) that run concurrently - each with
+    its own agent, since parallel crews must not share mutable agent
+    state.
+
+    Args:
+        user_choice: "1", "2" or "3"
+        agents: one Agent per spec in _GUIDE_SPECS[user_choice]
+    """
+    from crewai import Task
+
+    return [
+        Task(
+            description=description,
+            expected_output=expected_output,
+            agent=agent,
+            max_iter=1
+        )
+        for (description, expected_output), agent in zip(_GUIDE_SPECS[user_choice], agents)
+    ]
 
 def get_interaction_mode():
     """Get user's preferred interaction mode"""
@@ -126,35 +247,20 @@ def get_interaction_mode():
     print("2. Voice only (speech input/output)")
     print("3. Mixed mode (voice input, text + voice output)")
     
-    while True:
-        mode_choice = input("Enter your choice (1, 2, or 3): ").strip()
-        if mode_choice in ["1", "2", "3"]:
-            return mode_choice
-        print("❌ Invalid choice! Please enter 1, 2, or 3.")
+    return _ask_choice("Enter your choice (1, 2, or 3): ")
 
 def parse_voice_choice(text):
     """Parse voice input to determine user choice"""
     if not text:
         return None
-    
-    text = text.lower().strip()
-    
-    # Direct number recognition
-    if "1" in text or "one" in text:
-        return "1"
-    elif "2" in text or "two" in text:
-        return "2"
-    elif "3" in text or "three" in text:
-        return "3"
-    
-    # Keyword recognition
-    if any(word in text for word in ["food", "restaurant", "eat", "dining", "cook"]):
-        return "1"
-    elif any(word in text for word in ["activity", "activities", "things to do", "fun", "experience"]):
-        return "2"
-    elif any(word in text for word in ["both", "everything", "all", "food and activities"]):
-        return "3"
-    
+
+    # One pass over the transcript covers both numbers and keywords;
+    # IGNORECASE avoids allocating a lowercased copy and search() already
+    # stops at the first match
+    match = _CHOICE_RE.search(text)
+    if match:
+        return _CHOICE_GROUPS[match.lastgroup]
+
     # Default fallback
     return None
 
@@ -170,11 +276,7 @@ def get_user_choice_multimodal(mode, speech_manager):
     
     if mode == "1":  # Text only
         print(choice_prompt)
-        while True:
-            user_choice = input("Your choice (1, 2, or 3): ").strip()
-            if user_choice in ["1", "2", "3"]:
-                return user_choice
-            print("❌ Invalid choice! Please type 1, 2, or 3.")
+        return _ask_choice("Your choice (1, 2, or 3): ")
     
     elif mode == "2":  # Voice only
         if speech_manager:
@@ -203,12 +305,8 @@ def get_user_choice_multimodal(mode, speech_manager):
                 if voice_text:
                     parsed_choice = parse_voice_choice(voice_text)
                     if parsed_choice:
-                        choice_names = {"1": "food", "2": "activities", "3": "both"}
-                        print(f"✅ You chose: {choice_names[parsed_choice]}")
-                        confirmation = f"Perfect! I'll give you {choice_names[parsed_choice]} recommendations."
-                        transition = f"Let me start by introducing myself, and then I'll share some amazing {choice_names[parsed_choice]} suggestions that I think you'll really enjoy!"
-                        speech_manager.text_to_speech(confirmation, use_gtts=True)
-                        speech_manager.text_to_speech(transition, use_gtts=True)
+                        print(f"✅ You chose: {_CHOICE_NAMES[parsed_choice]}")
+                        _say_pair(speech_manager, parsed_choice, "voice")
                         return parsed_choice
                     else:
                         print(f"🤔 I heard: '{voice_text}'")
@@ -234,17 +332,10 @@ def get_user_choice_multimodal(mode, speech_manager):
         print("2. Things to do (activities)")
         print("3. Both food and activities")
         
-        while True:
-            user_choice = input("Your choice (1, 2, or 3): ").strip()
-            if user_choice in ["1", "2", "3"]:
-                if speech_manager:
-                    choice_names = {"1": "food", "2": "activities", "3": "both"}
-                    confirmation = f"Perfect! You chose {choice_names[user_choice]} recommendations. Now I'll continue in voice mode."
-                    transition = f"Let me introduce myself first, and then I'll share some excellent {choice_names[user_choice]} suggestions with you!"
-                    speech_manager.text_to_speech(confirmation, use_gtts=True)
-                    speech_manager.text_to_speech(transition, use_gtts=True)
-                return user_choice
-            print("❌ Invalid choice! Please type 1, 2, or 3.")
+        user_choice = _ask_choice("Your choice (1, 2, or 3): ")
+        if speech_manager:
+            _say_pair(speech_manager, user_choice, "voice_text_fallback")
+        return user_choice
     
     elif mode == "3":  # Mixed mode
         print(choice_prompt)
@@ -257,14 +348,10 @@ def get_user_choice_multimodal(mode, speech_manager):
         
         user_input = input("Your choice (1, 2, 3, or ENTER for voice): ").strip()
         
-        if user_input in ["1", "2", "3"]:
+        if user_input in _VALID_CHOICES:
             # Text input
             if speech_manager:
-                choice_names = {"1": "food", "2": "activities", "3": "both"}
-                confirmation = f"Perfect! You chose {choice_names[user_input]} recommendations."
-                transition = f"Let me start by introducing myself, and then I'll share some great {choice_names[user_input]} suggestions that I think you'll love!"
-                speech_manager.text_to_speech(confirmation, use_gtts=True)
-                speech_manager.text_to_speech(transition, use_gtts=True)
+                _say_pair(speech_manager, user_input, "mixed_text")
             return user_input
         elif user_input == "" and speech_manager:
             # Voice input
@@ -275,12 +362,8 @@ def get_user_choice_multimodal(mode, speech_manager):
             if voice_text:
                 parsed_choice = parse_voice_choice(voice_text)
                 if parsed_choice:
-                    choice_names = {"1": "food", "2": "activities", "3": "both"}
-                    print(f"✅ Voice input: You chose {choice_names[parsed_choice]}")
-                    confirmation = f"Great! I heard you chose {choice_names[parsed_choice]} recommendations."
-                    transition = f"Let me start by introducing myself, and then I'll share some wonderful {choice_names[parsed_choice]} suggestions that I think will be perfect for you!"
-                    speech_manager.text_to_speech(confirmation, use_gtts=True)
-                    speech_manager.text_to_speech(transition, use_gtts=True)
+                    print(f"✅ Voice input: You chose {_CHOICE_NAMES[parsed_choice]}")
+                    _say_pair(speech_manager, parsed_choice, "mixed_voice")
                     return parsed_choice
                 else:
                     print(f"🤔 I heard: '{voice_text}' - let's use text input instead")
@@ -290,17 +373,10 @@ def get_user_choice_multimodal(mode, speech_manager):
                 speech_manager.text_to_speech("I didn't hear anything. Let's try typing.", use_gtts=True)
         
         # Fallback to standard text input
-        while True:
-            user_choice = input("Your choice (1, 2, or 3): ").strip()
-            if user_choice in ["1", "2", "3"]:
-                if speech_manager:
-                    choice_names = {"1": "food", "2": "activities", "3": "both"}
-                    confirmation = f"Got it! You chose {choice_names[user_choice]}."
-                    transition = f"Now let me introduce myself, and then I'll share some fantastic {choice_names[user_choice]} recommendations that I think will be perfect for you!"
-                    speech_manager.text_to_speech(confirmation, use_gtts=True)
-                    speech_manager.text_to_speech(transition, use_gtts=True)
-                return user_choice
-            print("❌ Invalid choice! Please type 1, 2, or 3.")
+        user_choice = _ask_choice("Your choice (1, 2, or 3): ")
+        if speech_manager:
+            _say_pair(speech_manager, user_choice, "mixed_fallback")
+        return user_choice
 
 def output_multimodal(text, mode, speech_manager):
     """Output text with support for different interaction modes"""
@@ -314,15 +390,8 @@ def output_multimodal(text, mode, speech_manager):
     
     # Add speech output for voice and mixed modes
     if mode in ["2", "3"] and speech_manager:
-        # Clean the text for better speech output
-        clean_text = text
-        
-        # Remove excessive formatting for speech
-        clean_text = re.sub(r'\*\*([^*]+)\*\*', r'\1', clean_text)  # Remove bold formatting
-        clean_text = re.sub(r'\*([^*]+)\*', r'\1', clean_text)      # Remove italic formatting  
-        clean_text = re.sub(r'#{1,6}\s*', '', clean_text)           # Remove markdown headers
-        clean_text = re.sub(r'=+', '', clean_text)                  # Remove separator lines
-        clean_text = re.sub(r'[🎓🌟📍👋🍜🥢🌮🎨🏃🎭🎯]', '', clean_text)  # Remove emojis for cleaner speech
+        # Clean the text once for better speech output
+        clean_text = _clean_for_speech(text)
         
         # Split into meaningful chunks for better speech pacing
         # Handle different content types
@@ -337,52 +406,180 @@ def output_multimodal(text, mode, speech_manager):
             # Regular content - split by lines and paragraphs
             _speak_section(clean_text, speech_manager)
 
+# Practical upper bound for a single gTTS request
+_MAX_TTS_CHUNK = 500
+
 def _speak_section(text, speech_manager):
-    """Helper function to speak a section of text naturally"""
+    """Helper function to speak a section of text naturally
+
+    Consecutive lines are coalesced into one TTS request - each gTTS call
+    is a full HTTPS round-trip, so fewer, larger chunks cut voice-mode
+    latency far more than per-line pacing gains.
+    """
     if not text or not text.strip():
         return
-    
-    # Split into sentences and meaningful chunks
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
+
+    chunks = []
+    buffer = []
+
+    def flush():
+        if buffer:
+            chunks.append(" ".join(buffer))
+            buffer.clear()
+
+    # Strip each line exactly once and filter lazily - no intermediate
+    # list, and very short lines are skipped in the same pass
+    lines = (line for line in map(str.strip, text.split('\n')) if len(line) > 3)
+
     for line in lines:
-        if len(line) > 3:  # Skip very short lines
-            # Handle numbered lists specially
-            if re.match(r'^\d+\.', line):
-                # This is a numbered item - speak it as one unit
-                speech_manager.text_to_speech(line, use_gtts=True)
-            elif line.startswith("## "):
-                # Section header
-                header = line.replace("## ", "")
-                speech_manager.text_to_speech(f"Here are my {header.lower()} recommendations:", use_gtts=True)
-            else:
-                # Regular sentence
-                speech_manager.text_to_speech(line, use_gtts=True)
+        if line.startswith("## "):
+            # Section header - flush so the header stays a natural break
+            flush()
+            header = line.replace("## ", "")
+            buffer.append(f"Here are my {header.lower()} recommendations:")
+        else:
+            # Numbered items and regular sentences batch together
+            if sum(len(chunk) for chunk in buffer) + len(line) > _MAX_TTS_CHUNK:
+                flush()
+            buffer.append(line)
+
+    flush()
+
+    # One persistent pipeline speaks the whole stream without blocking here
+    speech_manager.speak_stream(chunks)
+
+def _write_guide(path, title, mode_name, intro_result, recommendations):
+    """Assemble and save the personalized guide file
+
+    Runs on a background thread so the disk write overlaps the closing
+    speech instead of delaying it.
+    """
+    # Assemble the full payload first so the file is written (and encoded)
+    # in a single pass instead of six small writes
+    payload = (
+        f"Tong's Multimodal Boston Guide - {title}\n"
+        f"{'=' * 70}\n\n"
+        f"Interaction Mode: {mode_name}\n\n"
+        "👋 Self Introduction\n"
+        f"{intro_result}\n\n"
+        "📍 Recommendations\n"
+        f"{recommendations}\n"
+    )
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(payload)
+    except OSError as e:
+        print(f"⚠️ Could not save guide file: {e}")
+
+def _stream_recommendations(llm, task, speech_manager):
+    """Generate a recommendation task's output as a token stream
+
+    crew.kickoff() only returns once the whole completion is done, which
+    leaves voice-mode users in silence for the full generation. Calling
+    the model through litellm with stream=True lets every finished
+    sentence go straight to the speech pipeline while the rest is still
+    being generated.
+    """
+    import litellm
+
+    messages = [
+        {"role": "system", "content": task.agent.backstory},
+        {
+            "role": "user",
+            "content": (
+                f"{task.description}\n\n"
+                f"Expected output:\n{task.expected_output}"
+            ),
+        },
+    ]
+
+    pieces = []
+    pending = ""
+
+    for chunk in litellm.completion(model=llm.model, messages=messages, stream=True):
+        delta = chunk.choices[0].delta.content or ""
+        if not delta:
+            continue
+        pieces.append(delta)
+        pending += delta
+
+        # Flush every completed sentence straight to the TTS queue
+        while True:
+            match = _SENTENCE_END_RE.search(pending)
+            if not match:
+                break
+            sentence = _clean_for_speech(pending[:match.end()]).strip()
+            pending = pending[match.end():]
+            if sentence:
+                speech_manager.enqueue_speech(sentence)
+
+        # A new numbered item also closes out the previous one, even when
+        # it did not end with sentence punctuation
+        boundary = _ITEM_START_RE.search(pending)
+        if boundary:
+            item = _clean_for_speech(pending[:boundary.start()]).strip()
+            pending = pending[boundary.end():]
+            if item:
+                speech_manager.enqueue_speech(item)
+
+    tail = _clean_for_speech(pending).strip()
+    if tail:
+        speech_manager.enqueue_speech(tail)
+
+    return "".join(pieces)
 
 def main():
+    # Keep CrewAI's per-step logging out of the critical path unless the
+    # user opted in - the formatted stderr writes add up on slow terminals
+    verbose = os.environ.get("TONG_VERBOSE", "0").strip().lower() not in ("", "0", "false", "no")
+    if not verbose:
+        import logging
+        logging.getLogger("crewai").setLevel(logging.WARNING)
+
     # Simple initial greeting - text only
     print("🎓 Multimodal Boston Guide Agent")
     print("=" * 35)
     
-    # Initialize speech manager quietly
-    speech_manager = None
-    try:
-        print("🔄 Initializing speech capabilities...")
-        speech_manager = SpeechManager(whisper_model_size="base")
-        print("✅ Speech system ready!")
-    except Exception as e:
-        print(f"⚠️ Speech initialization failed: {e}")
-        print("📝 Continuing with text-only mode...")
-    
+    # Load speech capabilities in the background - the Whisper weights load
+    # while the user reads the mode menu and types, so voice modes start
+    # without a multi-second pause and text-only mode never waits at all
+    speech_result = {}
+    speech_ready = threading.Event()
+
+    def _build_speech_manager():
+        try:
+            from speech_utils import SpeechManager
+            # tiny.en is plenty for the short English command vocabulary the
+            # agent listens for, and loads/transcribes ~4x faster than base
+            speech_result["manager"] = SpeechManager(whisper_model_size="tiny.en")
+        except Exception as e:
+            speech_result["error"] = e
+        finally:
+            speech_ready.set()
+
+    print("🔄 Initializing speech capabilities in the background...")
+    threading.Thread(target=_build_speech_manager, daemon=True).start()
+
     # Get interaction mode first
     mode = get_interaction_mode()
     mode_names = {
         "1": "Text only",
-        "2": "Voice only", 
+        "2": "Voice only",
         "3": "Mixed mode"
     }
-    
+
     print(f"\n🎛️ Using {mode_names[mode]} interaction")
+
+    # Only the voice modes ever block on the loader
+    speech_manager = None
+    if mode in ["2", "3"]:
+        speech_ready.wait()
+        speech_manager = speech_result.get("manager")
+        if speech_manager:
+            print("✅ Speech system ready!")
+        else:
+            print(f"⚠️ Speech initialization failed: {speech_result.get('error')}")
+            print("📝 Continuing with text-only mode...")
     
     # Now provide personalized welcome based on the chosen mode
     base_welcome = (
@@ -427,47 +624,50 @@ def main():
     # Get user choice with multimodal support
     user_choice = get_user_choice_multimodal(mode, speech_manager)
 
-    if user_choice not in ["1", "2", "3"]:
+    if user_choice not in _VALID_CHOICES:
         print("❌ Invalid choice! Exiting...")
         return
 
-    # Create Agent 1: Self Introduction Agent
-    self_intro_agent = Agent(
-        role='Tong - Harvard Data Science Student',
-        goal='Provide a warm, personalized introduction as Tong that highlights relevant interests based on user preference',
-        backstory="""You are Tong, a Harvard M.S. Data Science student originally from Shenzhen, China, 
-        who studied in Beijing for college. You love street dance (choreography and K-pop), cooking and tasting food, 
-        city walks, traveling, exploring new things, artistic experiences, movies, and caring for plants and animals 
-        (especially dogs and birds). You bring warmth, curiosity, and creativity into conversations, balancing 
-        technical strength with personal charm. You adapt your introduction based on what the person is interested in.""",
-        verbose=False,
-        allow_delegation=False,
-        llm=llm
-    )
+    # The introduction is pre-authored - no LLM call needed for it
+    intro_result = _TONG_INTROS[user_choice]
 
-    # Create Agent 2: Boston Guide Agent
-    boston_guide_agent = Agent(
-        role='Tong - Personal Boston Recommender',
-        goal='Provide personalized, current Boston recommendations based on personal introduction context',
-        backstory="""You are Tong, a Harvard M.S. Data Science student who is good at creating personalized recommendations 
-        based on your unique background, interests, and personality. You excel at connecting personal interests 
-        to specific places and experiences in the Boston area, especially for students.""",
-        verbose=False,
-        allow_delegation=False,
-        llm=llm
-    )
+    # Heavy crewai imports happen only once the user has chosen to proceed
+    from crewai import Agent, Crew, Process
+    llm = get_llm()
 
-    # Create tasks
-    intro_task = create_introduction_task(user_choice, self_intro_agent)
-    recommendation_task = create_boston_guide_task(user_choice, boston_guide_agent, intro_task)
+    # One agent instance per task - kickoff_async runs the choice-3 crews
+    # concurrently and Agent.execute_task mutates per-task state on its
+    # agent, so a shared instance would race. The shared backstory
+    # constant keeps the wire bytes (and prompt-cache prefix) identical.
+    tong_agents = [
+        Agent(
+            role='Tong - Harvard Data Science Student and Personal Boston Recommender',
+            goal='Provide personalized, current Boston recommendations based on personal introduction context',
+            backstory=_TONG_BACKSTORY,
+            verbose=verbose,
+            allow_delegation=False,
+            llm=llm
+        )
+        for _spec in _GUIDE_SPECS[user_choice]
+    ]
 
-    # Create crew with sequential process
-    crew = Crew(
-        agents=[self_intro_agent, boston_guide_agent],
-        tasks=[intro_task, recommendation_task],
-        process=Process.sequential,
-        verbose=False
-    )
+    # Create tasks with the prebaked introduction embedded as context
+    recommendation_tasks = create_boston_guide_tasks(user_choice, tong_agents)
+
+    # One crew per recommendation task - separate crews let the choice-3
+    # restaurant and activity lists generate in parallel
+    recommendation_crews = [
+        Crew(
+            agents=[task.agent],
+            tasks=[task],
+            process=Process.sequential,
+            verbose=verbose,
+            cache=True,      # let CrewAI reuse results for unchanged tasks
+            memory=False,
+            max_rpm=60       # stay under rate limits on repeated/batch runs
+        )
+        for task in recommendation_tasks
+    ]
 
     # Run the crew
     try:
@@ -475,11 +675,25 @@ def main():
             print("\n👋 Let me introduce myself and find perfect recommendations for you...")
         # For voice modes, go straight to introduction without redundant startup message
         
-        # Execute the crew
-        result = crew.kickoff()
-        
-        # Get introduction result
-        intro_result = intro_task.output.raw if hasattr(intro_task, 'output') else "Introduction completed"
+        # Check the on-disk cache first - the prompts are deterministic per choice,
+        # so repeat runs can skip the GPT-4o round-trips entirely
+        run_key = cache_key(
+            llm.model,
+            intro_result,
+            *[task.description for task in recommendation_tasks],
+            *[task.expected_output for task in recommendation_tasks],
+            user_choice
+        )
+        cached = load_cached(run_key)
+
+        # With a single recommendation task and a voice mode active, stream
+        # the recommendation sentence-by-sentence into the speech pipeline
+        stream_speech = (
+            not cached and mode in ["2", "3"] and speech_manager
+            and len(recommendation_tasks) == 1
+        )
+
+        result = cached["reco"] if cached else None
         
         # Output introduction - handle specially for complete speech
         if mode == "1":
@@ -492,19 +706,11 @@ def main():
                 print(intro_result)
             
             # Clean the introduction text for speech
-            clean_intro = intro_result
-            clean_intro = re.sub(r'\*\*([^*]+)\*\*', r'\1', clean_intro)  # Remove bold formatting
-            clean_intro = re.sub(r'\*([^*]+)\*', r'\1', clean_intro)      # Remove italic formatting  
-            clean_intro = re.sub(r'#{1,6}\s*', '', clean_intro)           # Remove markdown headers
-            clean_intro = re.sub(r'[🎓🌟📍👋🍜🥢🌮🎨🏃🎭🎯]', '', clean_intro)  # Remove emojis
-            clean_intro = clean_intro.strip()
-            
-            # Speak the entire introduction as one unit
-            speech_manager.text_to_speech(clean_intro, use_gtts=True)
+            clean_intro = _clean_for_speech(intro_result).strip()
             
-            # Small delay to ensure introduction fully completes before transition
-            import time
-            time.sleep(1.0)
+            # Queue the entire introduction as one unit - the pipeline keeps
+            # speech ordered while the recommendation LLM call runs below
+            speech_manager.enqueue_speech(clean_intro)
 
         # Add a natural transition
         if mode == "1":
@@ -512,10 +718,38 @@ def main():
             print(transition_message)
         elif mode in ["2", "3"] and speech_manager:
             transition_message = "Now that you know more about me, let me share my personalized Boston recommendations with you!"
-            speech_manager.text_to_speech(transition_message, use_gtts=True)
-        
+            speech_manager.enqueue_speech(transition_message)
+
+        # Generate recommendations now that the intro speech is queued, so
+        # playback overlaps the LLM call instead of waiting on it
+        if result is None:
+            if stream_speech:
+                result = _stream_recommendations(llm, recommendation_tasks[0], speech_manager)
+            else:
+                async def run_recommendation_crews():
+                    return await asyncio.gather(
+                        *[reco_crew.kickoff_async() for reco_crew in recommendation_crews]
+                    )
+
+                outputs = asyncio.run(run_recommendation_crews())
+                result = "\n\n".join(str(output) for output in outputs)
+
+            # Save the recommendations for next time
+            save_cached(run_key, {"reco": str(result)})
+
         # Output recommendations
-        output_multimodal(str(result), mode, speech_manager)
+        if stream_speech:
+            # Speech is already queued - just handle the text side
+            if mode == "2":
+                print("🔊 Speaking...")
+            else:
+                print(str(result))
+        else:
+            output_multimodal(str(result), mode, speech_manager)
+
+        # Let the queued recommendation speech finish before the closing message
+        if mode in ["2", "3"] and speech_manager:
+            speech_manager.wait_for_speech()
 
         # Save to file
         recommendation_type = {
@@ -524,18 +758,13 @@ def main():
             "3": "Food & Activity Recommendations"
         }
         
-        with open("personalized_boston_guide.txt", "w", encoding="utf-8") as f:
-            f.write(f"Tong's Multimodal Boston Guide - {recommendation_type[user_choice]}\n")
-            f.write("="*70 + "\n\n")
-            f.write(f"Interaction Mode: {mode_names[mode]}\n\n")
-
-            # Save self introduction
-            f.write("👋 Self Introduction\n")
-            f.write(intro_result + "\n\n")
-
-            # Save recommendations
-            f.write("📍 Recommendations\n")
-            f.write(str(result) + "\n")
+        # Write the file in the background while the closing message plays
+        threading.Thread(
+            target=_write_guide,
+            args=("personalized_boston_guide.txt", recommendation_type[user_choice],
+                  mode_names[mode], intro_result, str(result)),
+            daemon=True
+        ).start()
         
         # Natural closing
         if mode == "1":
@@ -560,8 +789,10 @@ def main():
                 speech_manager.text_to_speech("Sorry, there was an unexpected error.", use_gtts=True)
         
     finally:
-        # Clean up speech manager
+        # Clean up speech manager, letting queued speech finish first so
+        # cleanup never cuts off playback mid-sentence
         if speech_manager:
+            speech_manager.wait_for_speech()
             speech_manager.cleanup()
 
 if __name__ == "__main__":
@@ -4,68 +4,230 @@ Handles Speech-to-Text (STT) and Text-to-Speech (TTS) functionality
 """
 
 import os
+import io
+import math
 import time
-import tempfile
+import queue
+import hashlib
 import warnings
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Tuple
 import pyaudio
 import wave
 import whisper
 import pyttsx3
-import keyboard
+
+# faster-whisper (CTranslate2, int8) transcribes 3-5x faster than the
+# reference openai-whisper at the same model size - use it when installed
+try:
+    from faster_whisper import WhisperModel as FasterWhisperModel
+    FASTER_WHISPER_AVAILABLE = True
+    try:
+        from faster_whisper import BatchedInferencePipeline
+    except ImportError:
+        BatchedInferencePipeline = None  # Older faster-whisper release
+except ImportError:
+    FASTER_WHISPER_AVAILABLE = False
+    BatchedInferencePipeline = None
+import sys
+
+# Console key polling without the `keyboard` package - that module needs
+# root on Linux and installs a global hook on Windows just to watch one key
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import select
 import numpy as np
-from gtts import gTTS
 import pygame
 
+# Resolve optional TTS/decoding backends once at import - hot paths read
+# these flags instead of re-importing per call
+try:
+    from gtts import gTTS
+    GTTS_AVAILABLE = True
+except ImportError:
+    GTTS_AVAILABLE = False
+
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
 # Suppress warnings
 warnings.filterwarnings("ignore", category=UserWarning)
 warnings.filterwarnings("ignore", category=FutureWarning)
 
+# Disk cache for synthesized prompts - the menu, retry and fallback
+# strings are fixed, so after the first run they play with zero network latency
+TTS_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "boston_guide", "tts")
+
+# Characters stripped before speaking - markdown markers and status emojis.
+# One translate table means one C-level pass instead of a replace chain
+_STRIP_TABLE = str.maketrans('', '', '*#🔊🎤✅❌🌟📍👋')
+
+def _space_pressed() -> bool:
+    """Non-blocking check for a spacebar press on the console
+
+    On Windows msvcrt reads the key directly; on POSIX terminals stdin is
+    line-buffered, so stopping takes space + Enter there.
+    """
+    if sys.platform == "win32":
+        while msvcrt.kbhit():
+            if msvcrt.getwch() == ' ':
+                return True
+        return False
+    ready, _, _ = select.select([sys.stdin], [], [], 0)
+    return bool(ready) and ' ' in sys.stdin.readline()
+
 class SpeechManager:
-    def __init__(self, whisper_model_size: str = "base"):
+    def __init__(self, whisper_model_size: str = "tiny.en"):
         """
         Initialize Speech Manager with STT and TTS capabilities
-        
+
+        The agent is English-only, so the default is the English-only
+        tiny model: ~2x encoder throughput versus base with accuracy
+        that holds up fine for short command-style utterances. Pass
+        'base.en' (or larger) for quality-sensitive callers.
+
         Args:
-            whisper_model_size: Size of Whisper model to use ('tiny', 'base', 'small', 'medium', 'large')
+            whisper_model_size: Size of Whisper model to use ('tiny.en', 'base.en', 'small', 'medium', 'large')
         """
         self.whisper_model = None
         self.whisper_model_size = whisper_model_size
+        self._use_faster_whisper = False
+        self._batched_pipeline = None
+
+        # Bias decoding toward the proper nouns users actually say to a
+        # Boston guide - zero added FLOPs, fewer mistranscription retries
+        self._initial_prompt = (
+            "Boston landmarks including Fenway Park, Faneuil Hall, Copley Square, "
+            "the Freedom Trail, Back Bay, Beacon Hill, the Prudential, Quincy Market."
+        )
         self.tts_engine = None
         self.audio_format = pyaudio.paInt16
         self.channels = 1
         self.rate = 16000
-        self.chunk = 1024
+        # 256ms buffers: ~4 callbacks/s instead of ~16, same audio quality
+        self.chunk = 4096
         self.recording = False
-        
+
+        # In-memory memo over the disk cache so repeated prompts within a
+        # session (retries, confirmations) skip even the file read
+        self._synth_memo = {}
+
+        # Reusable capture buffer - recordings write into one preallocated
+        # bytearray instead of a list of bytes objects joined afterwards
+        self._record_buf = None
+
+        # Lazily-started speech pipeline: one worker synthesizes the next
+        # chunk while another plays the current one
+        self._tts_text_queue = None
+        self._tts_audio_queue = None
+        self._tts_threads = []
+
+        # Executor backing text_to_speech_async, started on first use
+        self._tts_executor = None
+
+
         # Initialize pygame mixer for audio playback
         pygame.mixer.init()
+
+        # One PortAudio context for the manager's lifetime - PyAudio()
+        # re-enumerates every host API and device (50-200ms on Windows),
+        # so record_audio reuses this instead of paying it per call
+        try:
+            self._pa = pyaudio.PyAudio()
+            self._sample_size = self._pa.get_sample_size(self.audio_format)
+        except Exception as e:
+            print(f"⚠️ Audio input unavailable: {e}")
+            self._pa = None
+            self._sample_size = 2
         
-        # Check gTTS availability
-        self.gtts_available = self._check_gtts_availability()
-        
+        # gTTS availability was resolved once at module import
+        self.gtts_available = GTTS_AVAILABLE
+        if not self.gtts_available:
+            print("⚠️ gTTS not available - will use local TTS only")
+
         self._load_whisper_model()
         self._setup_tts_engine()
-    
-    def _check_gtts_availability(self):
-        """Check if gTTS is available"""
-        try:
-            from gtts import gTTS
-            return True
-        except ImportError:
-            print("⚠️ gTTS not available - will use local TTS only")
-            return False
-    
+
     def _load_whisper_model(self):
-        """Load Whisper model for speech recognition"""
+        """Load the speech recognition model, preferring faster-whisper"""
         try:
-            print(f"🎤 Loading Whisper {self.whisper_model_size} model...")
-            self.whisper_model = whisper.load_model(self.whisper_model_size)
+            if FASTER_WHISPER_AVAILABLE:
+                print(f"🎤 Loading faster-whisper {self.whisper_model_size} model (int8)...")
+                self.whisper_model = FasterWhisperModel(
+                    self.whisper_model_size,
+                    device="cpu",
+                    compute_type="int8",
+                    cpu_threads=os.cpu_count() or 4,
+                    num_workers=1
+                )
+                self._use_faster_whisper = True
+            else:
+                print(f"🎤 Loading Whisper {self.whisper_model_size} model...")
+                # Let torch's FFT/matmul kernels use every core
+                import torch
+                torch.set_num_threads(os.cpu_count() or 4)
+                self.whisper_model = self._load_openai_whisper(torch)
             print("✅ Whisper model loaded successfully!")
+
+            # Warm up kernels/caches on a second of silence in the
+            # background so the first real utterance transcribes fast
+            threading.Thread(target=self._warmup_whisper, daemon=True).start()
         except Exception as e:
             print(f"❌ Error loading Whisper model: {e}")
             self.whisper_model = None
+
+    def _load_openai_whisper(self, torch):
+        """Load the reference whisper model via an mmap-able weight cache
+
+        whisper.load_model eagerly torch.loads and copies the whole
+        checkpoint (~140 MB for base) on every process start. After the
+        first load we persist the state dict in torch's format; repeat
+        starts memory-map it so weight pages fault in on demand instead
+        of being read and decoded up front. faster-whisper needs none of
+        this - CTranslate2 already mmaps its model files.
+        """
+        cache_path = os.path.join(
+            os.path.expanduser("~"), ".cache", "boston_guide",
+            f"whisper_{self.whisper_model_size}.pt"
+        )
+
+        if os.path.exists(cache_path):
+            try:
+                payload = torch.load(cache_path, map_location="cpu", mmap=True)
+                from whisper.model import ModelDimensions, Whisper
+                model = Whisper(ModelDimensions(**payload["dims"]))
+                model.load_state_dict(payload["state_dict"], assign=True)
+                return model.eval()
+            except Exception:
+                pass  # Stale or corrupt cache - fall through to a full load
+
+        model = whisper.load_model(self.whisper_model_size)
+
+        # Best-effort: seed the cache for the next cold start
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            torch.save(
+                {"dims": model.dims.__dict__, "state_dict": model.state_dict()},
+                tmp_path
+            )
+            os.replace(tmp_path, cache_path)
+        except Exception:
+            pass
+
+        return model
+
+    def _warmup_whisper(self):
+        """Run a throwaway transcription to prime the decoder"""
+        try:
+            self._transcribe(np.zeros(16000, dtype=np.float32))
+        except Exception:
+            pass  # Warmup is best-effort
     
     def _setup_tts_engine(self):
         """Setup pyttsx3 TTS engine"""
@@ -109,177 +271,325 @@ class SpeechManager:
             print(f"❌ Error initializing TTS engine: {e}")
             self.tts_engine = None
     
-    def record_audio(self, max_duration: int = 10) -> Optional[str]:
+    def record_audio(self, max_duration: int = 10, save_path: Optional[str] = None) -> Optional[np.ndarray]:
         """
-        Record audio from microphone and save to temporary file
-        
+        Record audio from microphone and return it as a numpy array
+
+        The frames go straight to Whisper in memory - no WAV round-trip
+        through disk. Pass save_path to additionally keep a WAV copy for
+        debugging.
+
         Args:
             max_duration: Maximum recording duration in seconds
-            
+            save_path: Optional path to also save the recording as WAV
+
         Returns:
-            Path to recorded audio file or None if failed
+            int16 mono audio at 16 kHz, or None if failed
         """
         if not self.whisper_model:
             print("❌ Whisper model not available")
             return None
         
+        if not self._pa:
+            print("❌ Audio input not available")
+            return None
+
         try:
-            # Initialize PyAudio
-            audio = pyaudio.PyAudio()
-            
+            # Reuse the PortAudio context opened at init
+            audio = self._pa
+
+            stop_event = threading.Event()
+
+            # Reuse one preallocated buffer across recordings - the
+            # callback copies straight into it, so finishing a take costs
+            # a single slice instead of joining N bytes objects
+            capacity = max_duration * self.rate * 2  # int16 = 2 bytes/sample
+            if self._record_buf is None or len(self._record_buf) < capacity:
+                self._record_buf = bytearray(capacity)
+            buf = memoryview(self._record_buf)
+
+            # Energy-based endpointing: once the user has spoken for at least
+            # 300ms, 500ms of trailing silence ends the recording early instead
+            # of always waiting out the full max_duration window. ceil keeps
+            # those durations honest whatever the chunk size - truncation
+            # would cut silence detection to one 256ms chunk at chunk=4096
+            min_speech_chunks = math.ceil(0.3 * self.rate / self.chunk)
+            min_silence_chunks = math.ceil(0.5 * self.rate / self.chunk)
+            state = {"speech": 0, "silence": 0, "noise_floor": None, "offset": 0}
+
+            # PortAudio's own realtime thread pushes chunks to us - no
+            # blocking stream.read loop and no extra Python thread
+            def on_audio(in_data, frame_count, time_info, status):
+                end = state["offset"] + len(in_data)
+                if end > capacity:
+                    stop_event.set()
+                    return (None, pyaudio.paComplete)
+                buf[state["offset"]:end] = in_data
+                state["offset"] = end
+
+                # Track chunk energy against the ambient noise floor
+                samples = np.frombuffer(in_data, dtype=np.int16)
+                rms = float(np.sqrt(np.mean(samples.astype(np.float32) ** 2)))
+                if state["noise_floor"] is None:
+                    state["noise_floor"] = rms  # First chunk calibrates the room
+                elif rms >= max(300.0, state["noise_floor"] * 3.0):
+                    state["speech"] += 1
+                    state["silence"] = 0
+                elif state["speech"] >= min_speech_chunks:
+                    state["silence"] += 1
+                    if state["silence"] >= min_silence_chunks:
+                        stop_event.set()
+                        return (None, pyaudio.paComplete)
+
+                return (None, pyaudio.paContinue)
+
             # Check if microphone is available
             try:
                 # Test microphone access first
                 info = audio.get_host_api_info_by_index(0)
                 print(f"🎤 Using audio device: {info.get('name', 'Default')}")
-                
+
                 stream = audio.open(
                     format=self.audio_format,
                     channels=self.channels,
                     rate=self.rate,
                     input=True,
                     input_device_index=None,  # Use default device
-                    frames_per_buffer=self.chunk
+                    frames_per_buffer=self.chunk,
+                    stream_callback=on_audio
                 )
             except Exception as e:
                 print(f"❌ Could not access microphone: {e}")
                 print("💡 Make sure microphone permissions are granted and device is not in use")
-                audio.terminate()
                 return None
-            
+
             print("🎤 Recording... Press SPACE to stop, or wait for automatic stop")
             print(f"   (Maximum duration: {max_duration} seconds)")
-            
-            frames = []
-            self.recording = True
+
             start_time = time.time()
-            
-            # Record in a separate thread to allow for key detection
-            def record_loop():
-                while self.recording and (time.time() - start_time) < max_duration:
-                    try:
-                        data = stream.read(self.chunk, exception_on_overflow=False)
-                        frames.append(data)
-                    except Exception as e:
-                        print(f"⚠️ Recording error: {e}")
-                        break
-            
-            # Start recording thread
-            record_thread = threading.Thread(target=record_loop)
-            record_thread.start()
-            
-            # Monitor for spacebar press
-            while self.recording and (time.time() - start_time) < max_duration:
-                if keyboard.is_pressed('space'):
+            self.recording = True
+
+            # Monitor for spacebar press while the callback records
+            while not stop_event.is_set() and (time.time() - start_time) < max_duration:
+                if _space_pressed():
                     print("🛑 Stopping recording...")
-                    self.recording = False
                     break
-                time.sleep(0.1)
-            
-            # Ensure recording stops
+                stop_event.wait(0.02)
+            else:
+                if stop_event.is_set():
+                    print("🛑 Detected end of speech")
+
             self.recording = False
-            record_thread.join(timeout=1)
-            
-            # Stop and close the stream
+
+            # Stop and close the stream (the PyAudio context stays open)
             stream.stop_stream()
             stream.close()
-            audio.terminate()
-            
-            if not frames:
+
+
+            if state["offset"] == 0:
                 print("❌ No audio recorded")
                 return None
-            
-            # Save recorded audio to temporary file
-            temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.wav')
-            temp_filename = temp_file.name
-            temp_file.close()  # Close the file handle so we can write to it
-            
-            with wave.open(temp_filename, 'wb') as wf:
-                wf.setnchannels(self.channels)
-                wf.setsampwidth(audio.get_sample_size(self.audio_format))
-                wf.setframerate(self.rate)
-                wf.writeframes(b''.join(frames))
-            
+
+            recorded = buf[:state["offset"]]
+
+            # Optional debug copy on disk - the transcription path itself
+            # never touches the filesystem
+            if save_path:
+                with wave.open(save_path, 'wb') as wf:
+                    wf.setnchannels(self.channels)
+                    wf.setsampwidth(self._sample_size)
+                    wf.setframerate(self.rate)
+                    wf.writeframes(recorded)
+
+            # Stay in int16 - half the bytes of float32 through the caches.
+            # The copy frees the pooled buffer for the next take; promotion
+            # to float32 happens once, right before the model
+            audio_data = np.frombuffer(recorded, dtype=np.int16).copy()
+
             duration = time.time() - start_time
             print(f"✅ Recorded {duration:.1f} seconds of audio")
-            
-            return temp_filename
-            
+
+            return audio_data
+
         except Exception as e:
             print(f"❌ Error recording audio: {e}")
             return None
     
-    def speech_to_text(self, audio_file: str) -> Optional[str]:
+    def speech_to_text(self, audio) -> Optional[str]:
         """
-        Convert audio file to text using Whisper with numpy array approach (Windows fix)
-        
+        Convert recorded audio to text using Whisper
+
+        Accepts the numpy array produced by record_audio directly (the
+        normal hot path - no disk involved) or a WAV file path for audio
+        that originated outside this process. Path inputs are
+        caller-owned and left in place.
+
         Args:
-            audio_file: Path to audio file
-            
+            audio: int16 or float32 mono 16 kHz np.ndarray, or path to an audio file
+
         Returns:
             Transcribed text or None if failed
         """
         if not self.whisper_model:
             print("❌ Whisper model not available")
             return None
-        
+
         try:
             print("🔄 Transcribing audio...")
-            
-            # Check if audio file exists and is readable
-            if not os.path.exists(audio_file):
-                print(f"❌ Audio file not found: {audio_file}")
-                return None
-            
-            if os.path.getsize(audio_file) == 0:
-                print("❌ Audio file is empty")
-                return None
-            
-            # Use librosa to load audio as numpy array (Windows Whisper file path fix)
-            try:
-                import librosa
-                print("📥 Loading audio with librosa...")
-                audio_data, sample_rate = librosa.load(audio_file, sr=16000)
-                print(f"✅ Audio loaded: {len(audio_data)} samples, {len(audio_data)/sample_rate:.1f}s")
-                
-                # Transcribe using numpy array instead of file path
-                result = self.whisper_model.transcribe(
-                    audio_data,  # Pass numpy array directly
-                    language="en",
-                    fp16=False,
-                    verbose=False
-                )
-                
-            except ImportError:
-                print("⚠️ librosa not available, trying file path method...")
-                # Fallback to file path (may fail on Windows)
-                result = self.whisper_model.transcribe(
-                    audio_file,
-                    language="en",
-                    fp16=False,
-                    verbose=False
-                )
-            
-            text = result["text"].strip()
-            
+
+            if isinstance(audio, str):
+                audio_input = self._load_audio_file(audio)
+                if audio_input is None:
+                    return None
+            else:
+                if audio is None or len(audio) == 0:
+                    print("❌ No audio recorded")
+                    return None
+                audio_input = audio
+
+            text = self._transcribe(audio_input)
+
             if text and len(text) > 0:
                 print(f"✅ Transcription: '{text}'")
                 return text
             else:
                 print("❌ No speech detected (empty transcription)")
                 return None
-                
+
         except Exception as e:
             print(f"❌ Error transcribing audio: {e}")
             return None
-        finally:
-            # Clean up temporary file
-            try:
-                if os.path.exists(audio_file):
-                    os.unlink(audio_file)
-            except:
-                pass
+
+    def _load_audio_file(self, audio_file: str):
+        """Load an audio file into the array/path form Whisper expects"""
+        # Check if audio file exists and is readable
+        if not os.path.exists(audio_file):
+            print(f"❌ Audio file not found: {audio_file}")
+            return None
+
+        if os.path.getsize(audio_file) == 0:
+            print("❌ Audio file is empty")
+            return None
+
+        # Load audio as a numpy array (Windows Whisper file path fix).
+        # soundfile does a plain WAV decode - the recording is already
+        # 16 kHz mono, so librosa's resampling machinery is only needed
+        # if some other sample rate slips in
+        if not SOUNDFILE_AVAILABLE:
+            print("⚠️ soundfile not available, trying file path method...")
+            # Fallback to file path (may fail on Windows)
+            return audio_file
+
+        print("📥 Loading audio with soundfile...")
+        audio_data, sample_rate = sf.read(audio_file, dtype='float32')
+        if audio_data.ndim > 1:
+            audio_data = audio_data.mean(axis=1)
+        if sample_rate != 16000:
+            import librosa
+            audio_data = librosa.resample(audio_data, orig_sr=sample_rate, target_sr=16000)
+            sample_rate = 16000
+        print(f"✅ Audio loaded: {len(audio_data)} samples, {len(audio_data)/sample_rate:.1f}s")
+        return audio_data
     
+    def _transcribe(self, audio) -> str:
+        """Run the loaded STT backend over audio (numpy array or file path)"""
+        if isinstance(audio, np.ndarray) and audio.dtype == np.int16:
+            # Single int16 -> float32 promotion at the model boundary
+            audio = audio.astype(np.float32) / 32768.0
+
+        if self._use_faster_whisper:
+            # Clips beyond one 30s window split into multiple VAD chunks;
+            # the batched pipeline runs those chunks through the encoder
+            # together instead of one window at a time
+            pipeline = None
+            if isinstance(audio, np.ndarray) and len(audio) > 30 * self.rate:
+                pipeline = self._get_batched_pipeline()
+
+            if pipeline is not None:
+                segments, _info = pipeline.transcribe(
+                    audio,
+                    language="en",
+                    beam_size=1,
+                    temperature=0.0,
+                    without_timestamps=True,
+                    initial_prompt=self._initial_prompt,
+                    batch_size=8
+                )
+            else:
+                # Greedy decoding is enough for short command utterances, and
+                # Silero VAD drops silent frames before the encoder sees them
+                segments, _info = self.whisper_model.transcribe(
+                    audio,
+                    language="en",
+                    beam_size=1,
+                    temperature=0.0,
+                    condition_on_previous_text=False,
+                    without_timestamps=True,
+                    initial_prompt=self._initial_prompt,
+                    vad_filter=True,
+                    vad_parameters=dict(min_silence_duration_ms=400)
+                )
+            return "".join(segment.text for segment in segments).strip()
+
+        if isinstance(audio, str) or len(audio) > 30 * self.rate:
+            # File paths and clips longer than one window go through the
+            # full transcribe dispatcher, which handles 30s windowing -
+            # pad_or_trim below would silently truncate them
+            result = self.whisper_model.transcribe(
+                audio,
+                language="en",
+                fp16=False,
+                verbose=False,
+                beam_size=1,
+                temperature=0.0,
+                condition_on_previous_text=False,
+                without_timestamps=True,
+                initial_prompt=self._initial_prompt
+            )
+            return result["text"].strip()
+
+        # Short in-memory clip: compute the log-Mel up front and decode
+        # once, skipping transcribe()'s windowing loop and progress machinery
+        segment = whisper.pad_or_trim(audio)
+        mel = whisper.log_mel_spectrogram(
+            segment, n_mels=self.whisper_model.dims.n_mels
+        ).to(self.whisper_model.device)
+        options = whisper.DecodingOptions(
+            language="en", fp16=False, without_timestamps=True, prompt=self._initial_prompt
+        )
+        return whisper.decode(self.whisper_model, mel, options).text.strip()
+
+    def _get_batched_pipeline(self):
+        """Lazily wrap the model in a BatchedInferencePipeline, if available
+
+        The pipeline batches the VAD-split chunks of a single clip
+        through the encoder together - a within-clip optimization, so it
+        only pays off for audio longer than one 30s window.
+        """
+        if not (self._use_faster_whisper and BatchedInferencePipeline):
+            return None
+        if self._batched_pipeline is None:
+            self._batched_pipeline = BatchedInferencePipeline(self.whisper_model)
+        return self._batched_pipeline
+
+    def transcribe_batch(self, audios) -> list:
+        """
+        Transcribe a sequence of clips, one result per clip
+
+        Clips are processed sequentially through the same path as
+        speech_to_text - CTranslate2 already uses every core within a
+        single call, so cross-clip concurrency would only add
+        contention. Long clips get their VAD-split chunks batched
+        through the encoder via BatchedInferencePipeline.
+
+        Args:
+            audios: iterable of np.ndarray clips (or file paths)
+
+        Returns:
+            List of transcribed strings, one per clip
+        """
+        return [self._transcribe(audio) for audio in audios]
+
     def text_to_speech_local(self, text: str) -> bool:
         """
         Convert text to speech using local pyttsx3 engine with better reliability
@@ -296,40 +606,22 @@ class SpeechManager:
         
         if not text or not text.strip():
             return False
-        
+
         try:
             print("🔊 Speaking...")
-            
-            # Create a fresh engine for each speech to avoid stuck states
-            import pyttsx3
-            temp_engine = pyttsx3.init(driverName='sapi5')
-            
-            # Copy settings from main engine
-            voices = temp_engine.getProperty('voices')
-            if voices:
-                # Use same voice as main engine
-                current_voice = self.tts_engine.getProperty('voice')
-                temp_engine.setProperty('voice', current_voice)
-            
-            temp_engine.setProperty('rate', 160)
-            temp_engine.setProperty('volume', 0.8)
-            
-            # Speak the text
-            temp_engine.say(text.strip())
-            temp_engine.runAndWait()
-            
-            # Clean up temp engine
-            temp_engine.stop()
-            del temp_engine
-            
+
+            # Reuse the engine built at init - re-running pyttsx3.init per
+            # call reloads the SAPI5 driver and re-enumerates voices
+            self.tts_engine.say(text.strip())
+            self.tts_engine.runAndWait()
             return True
-            
+
         except Exception as e:
             print(f"❌ Error with local TTS: {e}")
-            
-            # Fallback: try with main engine one more time
+
+            # Fallback: clear any stuck state and try once more
             try:
-                print("🔄 Retrying with main engine...")
+                print("🔄 Retrying after engine reset...")
                 self.tts_engine.stop()
                 time.sleep(0.1)
                 self.tts_engine.say(text.strip())
@@ -352,74 +644,228 @@ class SpeechManager:
             True if successful, False otherwise
         """
         try:
-            # Create gTTS object
-            tts = gTTS(text=text, lang=lang, slow=False)
-            
-            # Save to temporary file with unique name
-            import uuid
-            temp_file_path = os.path.join(tempfile.gettempdir(), f"tts_{uuid.uuid4().hex}.mp3")
-            tts.save(temp_file_path)
-            
-            # Ensure file is written
-            time.sleep(0.1)
-            
-            # Stop any currently playing audio
+            # synthesize() serves from the memo/disk cache when it can and
+            # renders straight into a BytesIO on a miss - no temp files,
+            # no 'ensure written' sleeps, and playback comes from memory
+            mp3_bytes = self.synthesize(text, lang)
+            if mp3_bytes is None:
+                return False
+            return self._play_mp3_bytes(mp3_bytes)
+
+        except Exception as e:
+            print(f"❌ Error with Google TTS: {e}")
+            return False
+    
+    def synthesize(self, text: str, lang: str = "en") -> Optional[bytes]:
+        """
+        Synthesize text to MP3 bytes via gTTS without playing it
+
+        Args:
+            text: Text to synthesize
+            lang: Language code (default: "en")
+
+        Returns:
+            MP3 bytes or None if failed
+        """
+        cache_path = self._tts_cache_path(text, lang)
+
+        mp3_bytes = self._synth_memo.get(cache_path)
+        if mp3_bytes is not None:
+            return mp3_bytes
+
+        try:
+            with open(cache_path, "rb") as f:
+                mp3_bytes = f.read()
+            # Mark as recently used for eviction - separately guarded so a
+            # failed touch (read-only cache dir) can't void the hit
+            try:
+                os.utime(cache_path)
+            except OSError:
+                pass
+        except OSError:
+            # Cache miss - synthesize and persist for future runs
+            try:
+                buf = io.BytesIO()
+                gTTS(text=text, lang=lang, slow=False).write_to_fp(buf)
+                mp3_bytes = buf.getvalue()
+                self._store_tts_cache(cache_path, mp3_bytes)
+            except Exception as e:
+                print(f"❌ Error synthesizing speech: {e}")
+                return None
+
+        # Bounded memo - the static prompt set is small, so 128 is plenty
+        if len(self._synth_memo) >= 128:
+            self._synth_memo.pop(next(iter(self._synth_memo)))
+        self._synth_memo[cache_path] = mp3_bytes
+        return mp3_bytes
+
+    def _tts_cache_path(self, text: str, lang: str) -> str:
+        """Disk cache location for a synthesized prompt"""
+        key = hashlib.sha1(f"{lang}|{text}".encode("utf-8")).hexdigest()
+        return os.path.join(TTS_CACHE_DIR, key + ".mp3")
+
+    def _store_tts_cache(self, cache_path: str, mp3_bytes: bytes):
+        """Best-effort save of synthesized audio for future runs"""
+        try:
+            os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(mp3_bytes)
+            os.replace(tmp_path, cache_path)
+            self._prune_tts_cache()
+        except OSError:
+            pass  # Caching must never break playback
+
+    @staticmethod
+    def _prune_tts_cache(budget_bytes: int = 100 * 1024 * 1024):
+        """Evict least-recently-played MP3s once the cache tops 100 MB"""
+        try:
+            entries = []
+            with os.scandir(TTS_CACHE_DIR) as it:
+                for entry in it:
+                    if entry.name.endswith(".mp3"):
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total = sum(size for _mtime, size, _path in entries)
+            if total <= budget_bytes:
+                return
+
+            # Oldest first - cache hits bump mtime, so this is LRU
+            for _mtime, size, path in sorted(entries):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    continue
+                total -= size
+                if total <= budget_bytes:
+                    break
+        except OSError:
+            pass
+
+    def _wait_for_playback(self, timeout: float = 120) -> bool:
+        """Block until the current clip finishes playing
+
+        Polls get_busy at 50ms. pygame's end-of-music event would be
+        nicer, but the SDL event queue needs the display subsystem
+        initialized and pumping from the main thread, while playback
+        here runs on a worker thread - so a short poll is the honest
+        option. The old 0.5s post-playback sleep stays gone.
+
+        Returns:
+            True if playback completed, False on timeout
+        """
+        start_time = time.time()
+        while pygame.mixer.music.get_busy() and (time.time() - start_time) < timeout:
+            time.sleep(0.05)
+        return (time.time() - start_time) < timeout
+
+    def _play_mp3_bytes(self, mp3_bytes: bytes) -> bool:
+        """Play pre-rendered MP3 bytes through pygame"""
+        try:
             pygame.mixer.music.stop()
-            time.sleep(0.1)
-            
-            # Load and play audio
-            pygame.mixer.music.load(temp_file_path)
+            pygame.mixer.music.load(io.BytesIO(mp3_bytes))
             pygame.mixer.music.play()
-            
-            # Wait for playback to finish with timeout
-            timeout = 120  # Increased to 2 minutes for long introductions
-            start_time = time.time()
-            while pygame.mixer.music.get_busy() and (time.time() - start_time) < timeout:
-                time.sleep(0.1)
-            
-            # Check if we timed out
-            elapsed_time = time.time() - start_time
-            if elapsed_time >= timeout:
-                print(f"⚠️ TTS timed out after {elapsed_time:.1f} seconds")
-            
-            # Ensure audio fully completes
-            time.sleep(0.5)
-            
-            # Clean up
-            try:
-                os.unlink(temp_file_path)
-            except:
-                pass  # File might be locked, ignore cleanup errors
-            
+            self._wait_for_playback()
             return True
-            
         except Exception as e:
-            print(f"❌ Error with Google TTS: {e}")
+            print(f"❌ Error playing audio: {e}")
             return False
-    
+
+    def _ensure_speech_pipeline(self):
+        """Start the synthesis and playback worker threads on first use"""
+        if self._tts_threads:
+            return
+
+        self._tts_text_queue = queue.Queue()
+        self._tts_audio_queue = queue.Queue(maxsize=2)
+
+        def synth_worker():
+            while True:
+                text = self._tts_text_queue.get()
+                try:
+                    if text is None:
+                        self._tts_audio_queue.put(None)
+                        break
+                    mp3_bytes = self.synthesize(text) if self.gtts_available else None
+                    self._tts_audio_queue.put((text, mp3_bytes))
+                finally:
+                    self._tts_text_queue.task_done()
+
+        def playback_worker():
+            while True:
+                item = self._tts_audio_queue.get()
+                try:
+                    if item is None:
+                        break
+                    text, mp3_bytes = item
+                    if mp3_bytes:
+                        self._play_mp3_bytes(mp3_bytes)
+                    else:
+                        # Offline fallback keeps the pipeline speaking
+                        self._speak_with_fresh_engine(text)
+                finally:
+                    self._tts_audio_queue.task_done()
+
+        for target in (synth_worker, playback_worker):
+            worker = threading.Thread(target=target, daemon=True)
+            worker.start()
+            self._tts_threads.append(worker)
+
+    def enqueue_speech(self, text: str) -> bool:
+        """
+        Queue text for pipelined synthesis + playback (non-blocking)
+
+        While one chunk plays, the next is already being synthesized, so
+        gTTS network latency hides behind playback time.
+        """
+        clean_text = self._clean_speech_text(text)
+        if not clean_text:
+            return False
+
+        self._ensure_speech_pipeline()
+        self._tts_text_queue.put(clean_text)
+        return True
+
+    def speak_stream(self, texts) -> None:
+        """
+        Queue an iterable of text chunks on the persistent speech pipeline
+
+        One pipeline (and one pygame mixer) serves the whole stream, so
+        synthesis setup and playback state are amortized across chunks
+        instead of being re-established per sentence.
+        """
+        for text in texts:
+            self.enqueue_speech(text)
+
+    def wait_for_speech(self):
+        """Block until everything queued so far has been spoken"""
+        if self._tts_threads:
+            self._tts_text_queue.join()
+            self._tts_audio_queue.join()
+
+    def _clean_speech_text(self, text: str) -> str:
+        """Clean up text for better speech"""
+        if not text:
+            return ""
+        return text.translate(_STRIP_TABLE).strip()
+
     def text_to_speech(self, text: str, use_gtts: bool = True) -> bool:
         """
         Convert text to speech with working method
-        
+
         Args:
             text: Text to convert to speech
             use_gtts: Try Google TTS first (requires internet)
-            
+
         Returns:
             True if successful, False otherwise
         """
-        if not text or not text.strip():
-            return False
-        
-        # Clean up text for better speech
-        clean_text = text.replace("**", "").replace("*", "").replace("#", "")
-        clean_text = clean_text.replace("🔊", "").replace("🎤", "").replace("✅", "").replace("❌", "")
-        clean_text = clean_text.replace("🌟", "").replace("📍", "").replace("👋", "")
-        clean_text = clean_text.strip()
-        
+        clean_text = self._clean_speech_text(text)
+
         if not clean_text:
             return False
-        
+
         # Switch to gTTS for better reliability and quality
         if use_gtts and self.gtts_available:
             return self.text_to_speech_gtts(clean_text)
@@ -427,35 +873,43 @@ class SpeechManager:
             # Fallback to local TTS if gTTS fails
             return self._speak_with_fresh_engine(clean_text)
     
+    def text_to_speech_async(self, text: str, use_gtts: bool = True) -> Future:
+        """
+        Start text_to_speech on a worker thread and return immediately
+
+        Lets callers overlap speech with the next step (recording, LLM
+        call) instead of waiting out the playback. Check .done() or call
+        .result() on the returned Future when the overlap window closes.
+
+        Args:
+            text: Text to convert to speech
+            use_gtts: Try Google TTS first (requires internet)
+
+        Returns:
+            Future resolving to text_to_speech's bool result
+        """
+        if self._tts_executor is None:
+            self._tts_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="tts")
+        return self._tts_executor.submit(self.text_to_speech, text, use_gtts)
+
     def _speak_with_fresh_engine(self, text: str) -> bool:
-        """Use main engine with proper synchronization and very long delays"""
+        """Speak via the persistent pyttsx3 engine"""
         try:
-            import time
-            
             if not self.tts_engine:
                 print("❌ No TTS engine available")
                 return False
-            
+
             # Clear any pending speech
             try:
                 self.tts_engine.stop()
             except:
                 pass
-            
-            # Wait a moment for engine to be ready
-            time.sleep(0.3)
-            
-            # Queue the text
+
+            # runAndWait blocks until the driver signals end of speech
             self.tts_engine.say(text)
-            
-            # Run and wait - this should block until complete
             self.tts_engine.runAndWait()
-            
-            # Ensure Windows audio completes
-            time.sleep(2.0)
-            
             return True
-            
+
         except Exception as e:
             print(f"❌ TTS Error: {e}")
             return False
@@ -474,41 +928,56 @@ class SpeechManager:
         print(f"\n{prompt}")
         print("🎤 Speak now...")
         
-        # Record audio
-        audio_file = self.record_audio(max_duration)
-        if not audio_file:
+        # Record audio straight into memory
+        audio = self.record_audio(max_duration)
+        if audio is None:
             return None
-        
+
         # Convert to text
-        text = self.speech_to_text(audio_file)
+        text = self.speech_to_text(audio)
         return text
     
     def cleanup(self):
         """Clean up resources"""
         try:
+            # Drain and stop the speech pipeline workers
+            if self._tts_threads:
+                self._tts_text_queue.put(None)
+                for worker in self._tts_threads:
+                    worker.join(timeout=5)
+                self._tts_threads = []
+            if self._tts_executor:
+                self._tts_executor.shutdown(wait=False)
+                self._tts_executor = None
             if self.tts_engine:
                 self.tts_engine.stop()
+            if self._pa:
+                self._pa.terminate()
+                self._pa = None
             pygame.mixer.quit()
         except:
             pass
 
 # Convenience functions for easy usage
-def create_speech_manager(model_size: str = "base") -> SpeechManager:
-    """Create and return a SpeechManager instance"""
-    return SpeechManager(model_size)
+_SINGLETON: Optional[SpeechManager] = None
+
+def create_speech_manager(model_size: str = "tiny.en") -> SpeechManager:
+    """Return the shared SpeechManager, creating it on first call
+
+    Loading Whisper weights dominates latency for short interactions, so
+    the manager is a process-wide singleton - repeat calls reuse the
+    already-loaded model.
+    """
+    global _SINGLETON
+    if _SINGLETON is None:
+        _SINGLETON = SpeechManager(model_size)
+    return _SINGLETON
 
 def voice_to_text(prompt: str = "Speak now:", max_duration: int = 10) -> Optional[str]:
     """Quick voice input function"""
-    manager = create_speech_manager()
-    try:
-        return manager.get_voice_input(prompt, max_duration)
-    finally:
-        manager.cleanup()
+    # No cleanup here - the shared manager stays warm for the next call
+    return create_speech_manager().get_voice_input(prompt, max_duration)
 
 def text_to_voice(text: str, use_gtts: bool = True) -> bool:
     """Quick text-to-speech function"""
-    manager = create_speech_manager()
-    try:
-        return manager.text_to_speech(text, use_gtts)
-    finally:
-        manager.cleanup()
\ No newline at end of file
+    return create_speech_manager().text_to_speech(text, use_gtts)
\ No newline at end of file